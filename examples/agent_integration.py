@@ -16,6 +16,7 @@ Replace the mock with your actual AI agent framework (OpenAI, Anthropic, etc.)
 import json
 import time
 import sys
+from collections import deque
 from typing import Dict, Any, List, Optional
 
 # Add parent directory to path for pico_claw import
@@ -29,6 +30,95 @@ except ImportError:
     print("Warning: pico_claw library not available. Using mock.")
 
 
+# ============================================================================
+# KEYWORD MATCHER
+# ============================================================================
+
+# Keyword bits consumed by MockAIAgent._simulate_ai_response
+KW_LED = 1 << 0
+KW_ON = 1 << 1
+KW_OFF = 1 << 2
+KW_READ = 1 << 3
+KW_SENSOR = 1 << 4
+KW_ADC = 1 << 5
+KW_HELP = 1 << 6
+
+_KEYWORDS = {
+    b"led": KW_LED,
+    b"on": KW_ON,
+    b"off": KW_OFF,
+    b"read": KW_READ,
+    b"sensor": KW_SENSOR,
+    b"adc": KW_ADC,
+    b"help": KW_HELP,
+}
+
+
+def _build_keyword_dfa(keywords):
+    """Compile keywords into a flat Aho-Corasick transition table
+
+    Returns (table, out) where table is a bytearray indexed by
+    state * 256 + byte and out maps each state to the bitmask of
+    keywords ending there. ASCII case folding is baked into the table,
+    so matching needs neither a .lower() copy nor multiple `in` scans.
+    """
+    goto = [{}]
+    out = [0]
+    for word, bit in keywords.items():
+        state = 0
+        for c in word:
+            nxt = goto[state].get(c)
+            if nxt is None:
+                goto.append({})
+                out.append(0)
+                nxt = len(goto) - 1
+                goto[state][c] = nxt
+            state = nxt
+        out[state] |= bit
+
+    # Breadth-first failure links (standard Aho-Corasick)
+    fail = [0] * len(goto)
+    queue = list(goto[0].values())
+    while queue:
+        state = queue.pop(0)
+        for c, s in goto[state].items():
+            queue.append(s)
+            f = fail[state]
+            while f and c not in goto[f]:
+                f = fail[f]
+            link = goto[f].get(c, 0)
+            fail[s] = link if link != s else 0
+            out[s] |= out[fail[s]]
+
+    def step(state, c):
+        while state and c not in goto[state]:
+            state = fail[state]
+        return goto[state].get(c, 0)
+
+    table = bytearray(len(goto) * 256)
+    for state in range(len(goto)):
+        base = state * 256
+        for c in range(256):
+            folded = c + 32 if 0x41 <= c <= 0x5A else c  # fold A-Z
+            table[base + c] = step(state, folded)
+    return table, out
+
+
+_KW_TABLE, _KW_OUT = _build_keyword_dfa(_KEYWORDS)
+
+
+def _keyword_hits(message: str) -> int:
+    """Single-pass scan of a message for all keywords; returns a bitmask"""
+    state = 0
+    hits = 0
+    table = _KW_TABLE
+    out = _KW_OUT
+    for c in message.encode("utf-8"):
+        state = table[(state << 8) + c]
+        hits |= out[state]
+    return hits
+
+
 # ============================================================================
 # MOCK AGENT (Replace with actual AI agent)
 # ============================================================================
@@ -45,7 +135,9 @@ class MockAIAgent:
     
     def __init__(self, claw: Optional[PicoClaw] = None):
         self.claw = claw
-        self.conversation_history: List[Dict[str, str]] = []
+        # Bounded ring of (role, content) tuples - dicts are only built
+        # when the history is handed to an LLM API
+        self.conversation_history: deque = deque(maxlen=64)
         self.system_prompt = """You are a hardware control AI assistant.
 You have access to a Raspberry Pi Pico microcontroller through which you can:
 - Control GPIO pins (turn LEDs on/off, read switches)
@@ -68,42 +160,42 @@ Always confirm actions and report sensor values."""
         In a real implementation, this would call an LLM API.
         Here we simulate the pattern.
         """
-        self.conversation_history.append({
-            "role": "user",
-            "content": user_message
-        })
-        
-        # Simulate AI thinking (in reality, call LLM here)
+        self.conversation_history.append(("user", user_message))
+
+        # Simulate AI thinking (in reality, call the LLM here with
+        # self._history_messages() as the conversation)
         response = self._simulate_ai_response(user_message)
-        
-        self.conversation_history.append({
-            "role": "assistant",
-            "content": response
-        })
-        
+
+        self.conversation_history.append(("assistant", response))
+
         return response
+
+    def _history_messages(self) -> List[Dict[str, str]]:
+        """Materialize history in the {role, content} shape LLM APIs expect"""
+        return [{"role": role, "content": content}
+                for role, content in self.conversation_history]
     
     def _simulate_ai_response(self, user_message: str) -> str:
         """Simulate AI response - replace with actual LLM call"""
-        user_lower = user_message.lower()
-        
-        if "led" in user_lower and "on" in user_lower:
+        hits = _keyword_hits(user_message)
+
+        if hits & KW_LED and hits & KW_ON:
             if self.claw:
                 self.claw.gpio_write(pin=25, value=1)
             return "I've turned on the on-board LED (GPIO 25)."
-        
-        elif "led" in user_lower and "off" in user_lower:
+
+        elif hits & KW_LED and hits & KW_OFF:
             if self.claw:
                 self.claw.gpio_write(pin=25, value=0)
             return "I've turned off the on-board LED."
-        
-        elif "read" in user_lower and ("sensor" in user_lower or "adc" in user_lower):
+
+        elif hits & KW_READ and hits & (KW_SENSOR | KW_ADC):
             if self.claw:
                 voltage = self.claw.adc_read_voltage(channel=0)
                 return f"ADC channel 0 voltage: {voltage:.3f}V"
             return "ADC reading: 0.000V (no hardware connected)"
         
-        elif "help" in user_lower:
+        elif hits & KW_HELP:
             return """I can help you control hardware. Try:
 - "Turn the LED on" / "Turn the LED off"
 - "Read the sensor on ADC channel 0"
@@ -214,6 +306,10 @@ PICO_CLAW_TOOLS = [
     }
 ]
 
+# Pre-encoded once at import time - every API call can reuse these bytes
+# instead of re-serializing the static schema per request
+PICO_CLAW_TOOLS_JSON = json.dumps(PICO_CLAW_TOOLS, separators=(",", ":")).encode("utf-8")
+
 
 # ============================================================================
 # AGENT EXECUTION LOOP
@@ -330,21 +426,25 @@ def openai_agents_example():
     
     # from openai import OpenAI
     # from agents import Agent, function_tool
+    # from agent_tools import tool_return
+    #
+    # Note: return the result dict directly (or via tool_return) - wrapping
+    # it in json.dumps makes the framework decode and re-encode the payload.
     #
     # @function_tool
-    # def gpio_write(pin: int, value: int) -> str:
+    # def gpio_write(pin: int, value: int):
     #     """Write to GPIO pin"""
-    #     return json.dumps(claw.gpio_write(pin, value))
+    #     return tool_return(claw.gpio_write(pin, value))
     #
     # @function_tool
-    # def gpio_read(pin: int) -> str:
+    # def gpio_read(pin: int):
     #     """Read GPIO pin"""
-    #     return json.dumps(claw.gpio_read(pin))
+    #     return tool_return(claw.gpio_read(pin))
     #
     # @function_tool
-    # def adc_read(channel: int) -> str:
+    # def adc_read(channel: int):
     #     """Read ADC channel"""
-    #     return json.dumps(claw.adc_read_voltage(channel))
+    #     return tool_return(claw.adc_read_voltage(channel))
     #
     # # Create agent
     # agent = Agent(
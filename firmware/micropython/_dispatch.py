@@ -0,0 +1,42 @@
+"""
+Generated by tools/gen_dispatch.py - do not edit by hand.
+"""
+
+
+def build_dispatch(registry):
+    """Bind registry tool methods into a positional switch dispatcher"""
+    _gpio_write = registry._gpio_write
+    _gpio_read = registry._gpio_read
+    _pwm_start = registry._pwm_start
+    _pwm_stop = registry._pwm_stop
+    _pwm_duty = registry._pwm_duty
+    _adc_read = registry._adc_read
+    _adc_read_voltage = registry._adc_read_voltage
+    _delay = registry._delay
+    _get_time = registry._get_time
+    _gpio_pulse = registry._gpio_pulse
+
+    def dispatch(tool_id, args):
+        if tool_id == 1:
+            return _gpio_write(args[0], args[1])
+        elif tool_id == 2:
+            return _gpio_read(args[0])
+        elif tool_id == 3:
+            return _pwm_start(args[0], args[1], args[2])
+        elif tool_id == 4:
+            return _pwm_stop(args[0])
+        elif tool_id == 5:
+            return _pwm_duty(args[0], args[1])
+        elif tool_id == 6:
+            return _adc_read(args[0])
+        elif tool_id == 7:
+            return _adc_read_voltage(args[0])
+        elif tool_id == 8:
+            return _delay(args[0])
+        elif tool_id == 9:
+            return _get_time()
+        elif tool_id == 10:
+            return _gpio_pulse(args[0], args[1], args[2])
+        return None
+
+    return dispatch
@@ -12,9 +12,18 @@ Target: Raspberry Pi Pico, Pico 2
 """
 
 import machine
+import micropython
+import select
+import ubinascii
 import ujson
 import uos
 import sys
+from machine import Pin, PWM, ADC, I2C, SPI, UART
+from micropython import const
+from time import sleep_us
+from ucollections import deque
+
+import wire
 
 # ============================================================================
 # CONFIGURATION
@@ -23,9 +32,50 @@ import sys
 VERSION = "1.0.0"
 BOARD = "RP2040" if hasattr(machine, "RP2040") else "RP2350"
 
+# Print swallowed callback exceptions; const(0) compiles the check away
+_DEBUG = const(0)
+
 # Serial configuration
 BAUD_RATE = 115200
 BUFFER_SIZE = 256
+OUT_BUFFER_SIZE = 512
+FRAME_BUFFER_SIZE = 1024
+POLL_TIMEOUT_MS = 10
+
+# Hot constants - const() inlines the integer at bytecode-compile time,
+# and module-level bindings avoid per-call machine.X attribute lookups
+_LED_PIN = const(25)
+_PIN_OUT = Pin.OUT
+_PIN_IN = Pin.IN
+
+# ============================================================================
+# NATIVE/VIPER HELPERS
+# ============================================================================
+
+@micropython.viper
+def _raw_to_mv(raw: int) -> int:
+    """Convert a 16-bit ADC reading to millivolts (3.3 V reference)"""
+    return (raw * 3300) >> 16
+
+
+# SIO GPIO_OUT_XOR lives at a different offset per chip: 0xD000001C on
+# the RP2040, 0xD0000028 on the RP2350 (SIO register maps in the
+# respective datasheets)
+_SIO_GPIO_OUT_XOR = 0xD000001C if BOARD == "RP2040" else 0xD0000028
+
+
+@micropython.viper
+def _gpio_pulse_raw(pin: int, count: int, half_period_us: int):
+    """Toggle a GPIO via the SIO OUT_XOR register - far faster than Pin.value"""
+    xor_reg = ptr32(_SIO_GPIO_OUT_XOR)
+    mask = 1 << pin
+    n = count * 2
+    i = 0
+    while i < n:
+        xor_reg[0] = mask
+        sleep_us(half_period_us)
+        i += 1
+
 
 # Pin definitions for common peripherals
 PINS = {
@@ -48,6 +98,19 @@ class ToolRegistry:
     
     def __init__(self):
         self.tools = {}
+        self.tools_by_id = {}
+        # Tool-list caches, invalidated on register/unregister
+        self._list_cache = None
+        self._list_json = None
+        # Peripheral object caches - constructors reconfigure the hardware
+        # and allocate on every call, so reuse objects across tool calls
+        self._pins = {}
+        self._pin_modes = {}
+        self._pwms = {}
+        self._pwm_freqs = {}
+        self._adcs = {}
+        self._i2cs = {}
+        self._i2c_bufs = {}  # length -> reusable read buffer
         self._register_builtin_tools()
     
     def _register_builtin_tools(self):
@@ -57,6 +120,7 @@ class ToolRegistry:
         self.register("gpio_mode", self._gpio_mode)
         self.register("gpio_write", self._gpio_write)
         self.register("gpio_read", self._gpio_read)
+        self.register("gpio_pulse", self._gpio_pulse)
         
         # PWM Tools
         self.register("pwm_start", self._pwm_start)
@@ -83,15 +147,23 @@ class ToolRegistry:
         
         # Delay Tool
         self.register("delay", self._delay)
-    
+
+        # Binary wire IDs for the hot-path tools (see wire.TOOL_FORMATS)
+        for name, (tool_id, _fmt) in wire.TOOL_FORMATS.items():
+            self.tools_by_id[tool_id] = self.tools[name]
+
     def register(self, name, func):
         """Register a new tool"""
         self.tools[name] = func
-    
+        self._list_cache = None
+        self._list_json = None
+
     def unregister(self, name):
         """Unregister a tool"""
         if name in self.tools:
             del self.tools[name]
+            self._list_cache = None
+            self._list_json = None
     
     def call(self, name, params=None):
         """Call a registered tool"""
@@ -110,95 +182,158 @@ class ToolRegistry:
             return {"error": str(e)}
     
     def list_tools(self):
-        """List all registered tools"""
-        return list(self.tools.keys())
+        """List all registered tools (cached until the registry changes)"""
+        if self._list_cache is None:
+            self._list_cache = list(self.tools.keys())
+        return self._list_cache
+
+    def list_tools_json(self):
+        """Pre-serialized {"tools": [...]} payload for list_tools requests"""
+        if self._list_json is None:
+            self._list_json = ujson.dumps({"tools": self.list_tools()}).encode('utf-8')
+        return self._list_json
     
+    # =========================================================================
+    # PERIPHERAL CACHE ACCESSORS
+    # =========================================================================
+
+    def _get_pin(self, pin, mode):
+        """Get a cached Pin, reconfiguring only when the mode changes"""
+        p = self._pins.get(pin)
+        if p is None:
+            p = Pin(pin, mode)
+            self._pins[pin] = p
+            self._pin_modes[pin] = mode
+        elif self._pin_modes[pin] != mode:
+            p.init(mode)
+            self._pin_modes[pin] = mode
+        return p
+
+    def _get_pwm(self, pin, frequency=None):
+        """Get a cached PWM, reprogramming the frequency only when changed"""
+        pwm = self._pwms.get(pin)
+        if pwm is None:
+            pwm = PWM(Pin(pin))
+            self._pwms[pin] = pwm
+        if frequency is not None and self._pwm_freqs.get(pin) != frequency:
+            pwm.freq(frequency)
+            self._pwm_freqs[pin] = frequency
+        return pwm
+
+    def _get_adc(self, channel):
+        """Get a cached ADC channel"""
+        adc = self._adcs.get(channel)
+        if adc is None:
+            adc = ADC(channel)
+            self._adcs[channel] = adc
+        return adc
+
+    def _get_i2c(self, scl, sda, frequency=400000):
+        """Get a cached I2C bus for the given pins/frequency"""
+        key = (scl, sda, frequency)
+        i2c = self._i2cs.get(key)
+        if i2c is None:
+            i2c = I2C(0, scl=Pin(scl), sda=Pin(sda), freq=frequency)
+            self._i2cs[key] = i2c
+        return i2c
+
     # =========================================================================
     # BUILT-IN TOOL IMPLEMENTATIONS
     # =========================================================================
-    
+
     # GPIO Tools
     def _gpio_mode(self, pin, mode="output"):
         """Set GPIO pin mode"""
-        p = machine.Pin(pin, machine.Pin.OUT if mode == "output" else machine.Pin.IN)
+        self._get_pin(pin, _PIN_OUT if mode == "output" else _PIN_IN)
         return {"pin": pin, "mode": mode}
-    
+
     def _gpio_write(self, pin, value):
         """Write to GPIO pin"""
-        p = machine.Pin(pin, machine.Pin.OUT)
-        p.value(value)
+        self._get_pin(pin, _PIN_OUT).value(value)
         return {"pin": pin, "value": value}
-    
+
     def _gpio_read(self, pin):
         """Read GPIO pin"""
-        p = machine.Pin(pin, machine.Pin.IN)
-        return {"pin": pin, "value": p.value()}
-    
+        return {"pin": pin, "value": self._get_pin(pin, _PIN_IN).value()}
+
+    def _gpio_pulse(self, pin, count=1, period_us=1000):
+        """Pulse a GPIO pin count times via the SIO XOR register"""
+        self._get_pin(pin, _PIN_OUT)  # ensure the pin is an output
+        _gpio_pulse_raw(pin, count, period_us // 2)
+        return {"pin": pin, "count": count, "period_us": period_us}
+
     # PWM Tools
     def _pwm_start(self, pin, frequency=1000, duty=0.5):
         """Start PWM on a pin"""
-        pwm = machine.PWM(machine.Pin(pin))
-        pwm.freq(frequency)
+        pwm = self._get_pwm(pin, frequency)
         pwm.duty_u16(int(duty * 65535))
         return {"pin": pin, "frequency": frequency, "duty": duty}
-    
+
     def _pwm_stop(self, pin):
         """Stop PWM on a pin"""
-        pwm = machine.PWM(machine.Pin(pin))
-        pwm.duty_u16(0)
+        self._get_pwm(pin).duty_u16(0)
         return {"pin": pin, "stopped": True}
-    
+
     def _pwm_duty(self, pin, duty):
         """Set PWM duty cycle"""
-        pwm = machine.PWM(machine.Pin(pin))
-        pwm.duty_u16(int(duty * 65535))
+        self._get_pwm(pin).duty_u16(int(duty * 65535))
         return {"pin": pin, "duty": duty}
-    
+
     # ADC Tools
+    @micropython.native
     def _adc_read(self, channel=0):
         """Read ADC channel (0-3 on RP2040)"""
-        adc = machine.ADC(channel)
-        return {"channel": channel, "raw": adc.read_u16()}
-    
+        return {"channel": channel, "raw": self._get_adc(channel).read_u16()}
+
+    @micropython.native
     def _adc_read_voltage(self, channel=0):
-        """Read ADC voltage"""
-        adc = machine.ADC(channel)
-        raw = adc.read_u16()
-        voltage = (raw / 65535) * 3.3
-        return {"channel": channel, "voltage": round(voltage, 3)}
-    
+        """Read ADC voltage in millivolts (integer-only fixed point)"""
+        raw = self._get_adc(channel).read_u16()
+        return {"channel": channel, "voltage_mV": _raw_to_mv(raw)}
+
     # I2C Tools
-    def _i2c_scan(self, scl=5, sda=4, frequency=400000):
-        """Scan I2C bus for devices"""
-        i2c = machine.I2C(0, scl=machine.Pin(scl), sda=machine.Pin(sda), freq=frequency)
-        devices = i2c.scan()
-        return {"devices": [hex(d) for d in devices], "count": len(devices)}
-    
+    def _i2c_scan(self, scl=5, sda=4, frequency=400000, format=None):
+        """Scan I2C bus for devices (raw int addresses; format="hex" for humans)"""
+        devices = self._get_i2c(scl, sda, frequency).scan()
+        if format == "hex":
+            devices = [hex(d) for d in devices]
+        return {"devices": devices, "count": len(devices)}
+
     def _i2c_read(self, address, register=0x00, length=1, scl=5, sda=4):
-        """Read from I2C device"""
-        i2c = machine.I2C(0, scl=machine.Pin(scl), sda=machine.Pin(sda))
-        data = i2c.readfrom_mem(address, register, length)
-        return {"address": hex(address), "data": list(data)}
-    
-    def _i2c_write(self, address, register=0x00, data=None, scl=5, sda=4):
-        """Write to I2C device"""
-        i2c = machine.I2C(0, scl=machine.Pin(scl), sda=machine.Pin(sda))
+        """Read from I2C device (into a reusable per-length scratch buffer)"""
+        i2c = self._get_i2c(scl, sda)
+        buf = self._i2c_bufs.get(length)
+        if buf is None:
+            buf = bytearray(length)
+            self._i2c_bufs[length] = buf
+        i2c.readfrom_mem_into(address, register, buf)
+        # base64 keeps the payload a single string instead of boxing
+        # every byte into a Python int for ujson
+        return {"address": address, "data_b64": ubinascii.b2a_base64(buf)[:-1].decode()}
+
+    def _i2c_write(self, address, register=0x00, data=None, data_hex=None, scl=5, sda=4):
+        """Write to I2C device (data_hex preferred; data list kept for compat)"""
+        i2c = self._get_i2c(scl, sda)
+        if data_hex:
+            data = ubinascii.unhexlify(data_hex)
         if data:
-            i2c.writeto_mem(address, register, bytes(data))
-        return {"address": hex(address), "written": len(data) if data else 0}
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                data = bytes(data)
+            i2c.writeto_mem(address, register, data)
+        return {"address": address, "written": len(data) if data else 0}
     
     # SPI Tools
     def _spi_read(self, frequency=1000000, length=1, sck=6, mosi=7, miso=4):
         """Read from SPI"""
-        spi = machine.SPI(0, baudrate=frequency, sck=machine.Pin(sck), 
-                         mosi=machine.Pin(mosi), miso=machine.Pin(miso))
+        spi = SPI(0, baudrate=frequency, sck=Pin(sck), 
+                         mosi=Pin(mosi), miso=Pin(miso))
         data = spi.read(length)
         return {"data": list(data)}
     
     def _spi_write(self, data, frequency=1000000, sck=6, mosi=7, miso=4):
         """Write to SPI"""
-        spi = machine.SPI(0, baudrate=frequency, sck=machine.Pin(sck), 
-                         mosi=machine.Pin(mosi), miso=machine.Pin(miso))
+        spi = SPI(0, baudrate=frequency, sck=Pin(sck), 
+                         mosi=Pin(mosi), miso=Pin(miso))
         spi.write(bytes(data))
         return {"written": len(data)}
     
@@ -238,22 +373,22 @@ class ContextManager:
     
     def __init__(self, max_history=10):
         self.max_history = max_history
-        self.history = []
+        # Bounded ring: overflowing appends drop the oldest entry in
+        # O(1) (the default; the flags arg would make append raise)
+        self.history = deque((), max_history)
         self.state = {}
-    
+
     def add(self, role, content):
         """Add a message to history"""
         self.history.append({"role": role, "content": content})
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
-    
+
     def get_history(self):
         """Get conversation history"""
-        return self.history
-    
+        return list(self.history)
+
     def clear(self):
         """Clear history"""
-        self.history = []
+        self.history = deque((), self.max_history)
     
     def set_state(self, key, value):
         """Set state value"""
@@ -276,13 +411,29 @@ class AgentEngine:
         self.context = ContextManager()
         self.running = False
         self.event_callbacks = []
+
+        # Generated switch dispatcher for the binary path (no dict lookup,
+        # no kwargs binding); regenerate with tools/gen_dispatch.py
+        try:
+            from _dispatch import build_dispatch
+            self._dispatch = build_dispatch(self.registry)
+        except ImportError:
+            self._dispatch = None
     
     def execute(self, instruction):
         """Execute an instruction"""
+        if isinstance(instruction, (bytes, bytearray, memoryview)):
+            if bytes(instruction[:4]) == wire.MAGIC:
+                return self._execute_binary(instruction)
+            try:
+                instruction = bytes(instruction).decode('utf-8')
+            except UnicodeError:
+                return {"error": "Invalid frame"}
+
         if isinstance(instruction, str):
             try:
                 instruction = ujson.loads(instruction)
-            except:
+            except ValueError:
                 return {"error": "Invalid JSON"}
         
         if not isinstance(instruction, dict):
@@ -302,7 +453,14 @@ class AgentEngine:
             return {"error": "Dynamic registration not implemented"}
         
         elif cmd == "list_tools":
-            return {"tools": self.registry.list_tools()}
+            # Pre-encoded bytes pass straight through the response path
+            return self.registry.list_tools_json()
+
+        elif cmd == "set_framing":
+            mode = instruction.get("mode", "line")
+            if mode in ("line", "binary"):
+                return {"framing": mode}
+            return {"error": f"Unknown framing: {mode}"}
         
         elif cmd == "context":
             action = instruction.get("action", "get")
@@ -329,7 +487,38 @@ class AgentEngine:
                 return {"key": key, "value": self.context.get_state(key)}
         
         return {"error": f"Unknown command: {cmd}"}
-    
+
+    def _execute_binary(self, frame):
+        """Execute a binary wire frame via the JSON-compatible envelope"""
+        ok, result = self.execute_fast(frame)
+        if ok:
+            return {"result": result}
+        return {"error": result}
+
+    def execute_fast(self, frame):
+        """Fused dispatch for binary frames (hot path)
+
+        Returns (ok, result) with no intermediate envelope dicts - the
+        caller hands the result straight to the bridge.
+        """
+        try:
+            tool_id, args = wire.unpack_frame(frame)
+        except ValueError as e:
+            return False, str(e)
+
+        try:
+            if self._dispatch is not None:
+                result = self._dispatch(tool_id, args)
+            else:
+                func = self.registry.tools_by_id.get(tool_id)
+                result = func(*args) if func is not None else None
+        except Exception as e:
+            return False, str(e)
+
+        if result is None:
+            return False, f"Unknown tool id: {tool_id}"
+        return True, result
+
     def on_event(self, callback):
         """Register event callback"""
         self.event_callbacks.append(callback)
@@ -339,55 +528,168 @@ class AgentEngine:
         for callback in self.event_callbacks:
             try:
                 callback(event_type, data)
-            except:
-                pass
+            except Exception as e:
+                if _DEBUG:
+                    sys.print_exception(e)
 
 
 # ============================================================================
 # COMMUNICATION BRIDGE
 # ============================================================================
 
+# Response framing is a fixed 2-key schema, so the envelope is emitted as
+# literal bytes instead of building a dict and running it through ujson
+_OK_PREFIX = b'{"status":"ok","data":'
+_ERR_PREFIX = b'{"status":"error","error":'
+
+
+def _encode_value(value):
+    """Encode a response value, bypassing ujson for primitives"""
+    if isinstance(value, bytes):
+        return value  # already-encoded JSON
+    if value is True:
+        return b'true'
+    if value is False:
+        return b'false'
+    if value is None:
+        return b'null'
+    if isinstance(value, int):
+        return str(value).encode()
+    return ujson.dumps(value).encode('utf-8')
+
+
 class CommunicationBridge:
     """Handles serial communication with host"""
     
     def __init__(self, uart_id=0, baudrate=BAUD_RATE):
-        self.uart = machine.UART(uart_id, baudrate)
-        self.buffer = ""
-    
+        self.uart = UART(uart_id, baudrate)
+        self.buffer = bytearray()
+        self._tmp = bytearray(BUFFER_SIZE)
+        self._out = bytearray(OUT_BUFFER_SIZE)
+        # Bound methods - skip the uart attribute lookup on the hot path
+        self._any = self.uart.any
+        self._readinto = self.uart.readinto
+        self._write = self.uart.write
+        # Transport framing: "line" (newline-terminated JSON) or "binary"
+        # (<len:u16 le><payload>, switched via the set_framing command)
+        self.framing = "line"
+        self._frame_buf = bytearray(FRAME_BUFFER_SIZE)
+
+    def _fill(self):
+        """Drain pending UART bytes into the receive buffer"""
+        n = self._any()
+        if n:
+            if n > BUFFER_SIZE:
+                n = BUFFER_SIZE
+            mv = memoryview(self._tmp)[:n]
+            n = self._readinto(mv)
+            if n:
+                self.buffer.extend(mv[:n])
+
+    def pending(self):
+        """True if a complete message is already buffered"""
+        buf = self.buffer
+        if self.framing == "line":
+            return b'\n' in buf
+        if len(buf) < 2:
+            return False
+        return len(buf) >= 2 + (buf[0] | (buf[1] << 8))
+
     def readline(self):
         """Read a line from serial"""
-        if self.uart.any():
-            data = self.uart.read()
-            if data:
-                try:
-                    self.buffer += data.decode('utf-8')
-                except:
-                    pass
-                
-                if '\n' in self.buffer:
-                    lines = self.buffer.split('\n')
-                    self.buffer = lines[-1]
-                    return lines[0]
+        self._fill()
+
+        i = self.buffer.find(b'\n')
+        if i >= 0:
+            line = bytes(self.buffer[:i])
+            del self.buffer[:i + 1]
+            try:
+                return line.decode('utf-8')
+            except UnicodeError:
+                return None
         return None
-    
+
+    def read_frame(self):
+        """Read one length-prefixed frame: <len:u16 le><payload>
+
+        O(1) to parse - no newline scan, no decode, and payloads may
+        contain any byte. Returns a memoryview over a reusable buffer.
+        """
+        self._fill()
+        buf = self.buffer
+        if len(buf) < 2:
+            return None
+        length = buf[0] | (buf[1] << 8)
+        if len(buf) < 2 + length:
+            return None
+        if length > len(self._frame_buf):
+            self._frame_buf = bytearray(length)
+        frame = memoryview(self._frame_buf)[:length]
+        frame[:] = buf[2:2 + length]
+        del buf[:2 + length]
+        return frame
+    
+    def write_bytes(self, data):
+        """Send pre-encoded bytes plus newline in a single uart.write"""
+        n = len(data)
+        out = self._out
+        if n + 1 > len(out):
+            out = bytearray(n + 1)
+            self._out = out
+        out[:n] = data
+        out[n] = 0x0A  # '\n'
+        self._write(memoryview(out)[:n + 1])
+
+    def write_dict(self, data):
+        """Serialize and send a dict"""
+        self.write_bytes(ujson.dumps(data).encode('utf-8'))
+
     def write(self, data):
-        """Write data to serial"""
+        """Write data to serial (generic; prefer write_dict/write_bytes)"""
         if isinstance(data, dict):
-            data = ujson.dumps(data)
-        self.uart.write(data + '\n')
-    
-    def respond(self, status, data):
-        """Send a response"""
-        response = {"status": status}
-        if status == "ok":
-            response["data"] = data
+            self.write_dict(data)
+        elif isinstance(data, str):
+            self.write_bytes(data.encode('utf-8'))
         else:
-            response["error"] = data
-        self.write(response)
+            self.write_bytes(data)
     
+    def respond(self, status, data):
+        """Send a response (hand-emitted envelope, one uart.write)"""
+        prefix = _OK_PREFIX if status == "ok" else _ERR_PREFIX
+        payload = _encode_value(data)
+        p = len(prefix)
+        n = p + len(payload) + 2
+        out = self._out
+        if n > len(out):
+            out = bytearray(n)
+            self._out = out
+        out[:p] = prefix
+        out[p:n - 2] = payload
+        out[n - 2] = 0x7D  # '}'
+        out[n - 1] = 0x0A  # '\n'
+        self._write(memoryview(out)[:n])
+    
+    def respond_frame(self, ok, payload):
+        """Send a binary response: <len:u16 le><status:u8><payload>"""
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        elif not isinstance(payload, bytes):
+            payload = _encode_value(payload)
+        n = len(payload) + 1
+        total = n + 2
+        out = self._out
+        if total > len(out):
+            out = bytearray(total)
+            self._out = out
+        out[0] = n & 0xFF
+        out[1] = (n >> 8) & 0xFF
+        out[2] = wire.RESP_OK if ok else wire.RESP_ERR
+        out[3:total] = payload
+        self._write(memoryview(out)[:total])
+
     def send_event(self, event_type, data):
         """Send an event"""
-        self.write({"event": event_type, "data": data})
+        self.write_dict({"event": event_type, "data": data})
 
 
 # ============================================================================
@@ -402,8 +704,9 @@ class PicoClawAgent:
         self.bridge = CommunicationBridge()
         
         # Set up LED for status
-        self.led = machine.Pin(25, machine.Pin.OUT)
+        self.led = Pin(_LED_PIN, _PIN_OUT)
         self.led.off()
+        self._cmds = 0
         
         # Register event handler
         self.agent.on_event(self._handle_event)
@@ -419,7 +722,7 @@ class PicoClawAgent:
         print(f"Board: {BOARD}")
         print("=" * 50)
         
-        self.bridge.write({
+        self.bridge.write_dict({
             "event": "ready",
             "data": {
                 "version": VERSION,
@@ -435,30 +738,65 @@ class PicoClawAgent:
     
     def _main_loop(self):
         """Main execution loop"""
+        poller = select.poll()
+        poller.register(self.bridge.uart, select.POLLIN)
+
+        bridge = self.bridge
         while self.running:
-            line = self.bridge.readline()
-            
-            if line:
-                line = line.strip()
-                if not line:
+            # Sleep on the UART unless a complete message is already buffered
+            if not bridge.pending() and not poller.poll(POLL_TIMEOUT_MS):
+                continue
+
+            if bridge.framing == "line":
+                msg = bridge.readline()
+                if msg:
+                    msg = msg.strip()
+            else:
+                msg = bridge.read_frame()
+
+            if not msg:
+                continue
+
+            # Blink LED every 64 commands - two MMIO writes per command
+            # would serialize with the response on tight polling loops
+            self._cmds += 1
+            if self._cmds & 0x3F == 0:
+                self.led.toggle()
+
+            try:
+                if bridge.framing == "binary" and len(msg) >= wire.HEADER_SIZE \
+                        and bytes(msg[:4]) == wire.MAGIC:
+                    # Fused hot path: no envelope dicts, binary response
+                    ok, result = self.agent.execute_fast(msg)
+                    bridge.respond_frame(ok, result)
                     continue
-                
-                # Blink LED on command
-                self.led.off()
-                
-                try:
-                    result = self.agent.execute(line)
-                    
-                    if "error" in result:
-                        self.bridge.respond("error", result["error"])
-                    else:
-                        self.bridge.respond("ok", result)
-                
-                except Exception as e:
-                    self.bridge.respond("error", str(e))
-                
-                self.led.on()
-    
+
+                result = self.agent.execute(msg)
+                self._send_result(result)
+
+                # Framing switches take effect after the ack
+                if isinstance(result, dict) and "framing" in result:
+                    bridge.framing = result["framing"]
+
+            except Exception as e:
+                self._send_result({"error": str(e)})
+
+    def _send_result(self, result):
+        """Route a generic execute result through the active framing"""
+        bridge = self.bridge
+        if not isinstance(result, dict):
+            # Pre-encoded payload (e.g. cached list_tools JSON)
+            ok, payload = True, result
+        elif "error" in result:
+            ok, payload = False, result["error"]
+        else:
+            ok, payload = True, result
+
+        if bridge.framing == "binary":
+            bridge.respond_frame(ok, payload)
+        else:
+            bridge.respond("ok" if ok else "error", payload)
+
     def stop(self):
         """Stop the agent"""
         self.running = False
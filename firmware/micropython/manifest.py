@@ -0,0 +1,25 @@
+"""
+Pico Claw Agent - Frozen Module Manifest
+
+Freezing the firmware into the MicroPython image keeps the bytecode in
+flash instead of parsing main.py at boot and holding it in GC heap,
+which cuts startup time and frees RAM for I2C/SPI buffers.
+
+Build a firmware image with the modules frozen in:
+
+    cd micropython/ports/rp2
+    make BOARD=RPI_PICO FROZEN_MANIFEST=/path/to/firmware/micropython/manifest.py
+
+(use BOARD=RPI_PICO2 for the RP2350.)
+
+To deploy precompiled bytecode without rebuilding the firmware, use
+mpy-cross instead:
+
+    mpy-cross -O3 main.py wire.py _dispatch.py
+
+-O3 strips assertions and line numbers from the compiled output.
+"""
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+freeze(".", ("main.py", "wire.py", "_dispatch.py"), opt=3)
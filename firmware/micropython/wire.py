@@ -0,0 +1,74 @@
+"""
+Pico Claw Agent - Binary Wire Format
+
+Compact struct-based framing for the device-host hot path. A frame is a
+fixed header followed by positional arguments packed with ustruct:
+
+    "PCLW" <ver:u8> <flags:u8> <tool_id:u8> <len:u16> <payload:len bytes>
+
+Only the numeric hot-path tools get binary encodings; JSON framing stays
+available as the fallback for registration, context and debug commands.
+"""
+
+try:
+    import ustruct
+except ImportError:  # host-side tooling (tools/gen_dispatch.py)
+    import struct as ustruct
+
+MAGIC = b"PCLW"
+VERSION = 1
+
+HEADER_FMT = "<4sBBBH"
+HEADER_SIZE = 9
+
+# Status byte in binary responses (<len:u16 le><status:u8><payload>)
+RESP_OK = 0
+RESP_ERR = 1
+
+# Tool name -> (tool_id, ustruct format for positional args).
+# Formats mirror the positional order of the tool implementations in
+# ToolRegistry; tools with string or variable-length params stay on JSON.
+TOOL_FORMATS = {
+    "gpio_write": (1, "<BB"),        # pin, value
+    "gpio_read": (2, "<B"),          # pin
+    "pwm_start": (3, "<BIf"),        # pin, frequency, duty
+    "pwm_stop": (4, "<B"),           # pin
+    "pwm_duty": (5, "<Bf"),          # pin, duty
+    "adc_read": (6, "<B"),           # channel
+    "adc_read_voltage": (7, "<B"),   # channel
+    "delay": (8, "<I"),              # milliseconds
+    "get_time": (9, ""),
+    "gpio_pulse": (10, "<BHI"),      # pin, count, period_us
+}
+
+# tool_id -> ustruct format, for the decode side
+FORMATS_BY_ID = {tid: fmt for tid, fmt in TOOL_FORMATS.values()}
+
+
+def pack_frame(tool_id, args=(), buf=None):
+    """Pack a command frame; returns a memoryview over buf (or a new buffer)"""
+    fmt = FORMATS_BY_ID[tool_id]
+    length = ustruct.calcsize(fmt) if fmt else 0
+    total = HEADER_SIZE + length
+    if buf is None or len(buf) < total:
+        buf = bytearray(total)
+    ustruct.pack_into(HEADER_FMT, buf, 0, MAGIC, VERSION, 0, tool_id, length)
+    if fmt:
+        ustruct.pack_into(fmt, buf, HEADER_SIZE, *args)
+    return memoryview(buf)[:total]
+
+
+def unpack_frame(data):
+    """Unpack a command frame into (tool_id, args tuple)
+
+    Raises ValueError on a bad magic/version/length.
+    """
+    magic, version, _flags, tool_id, length = ustruct.unpack_from(HEADER_FMT, data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("bad frame header")
+    if len(data) < HEADER_SIZE + length:
+        raise ValueError("short frame")
+    fmt = FORMATS_BY_ID.get(tool_id)
+    if fmt is None:
+        return tool_id, ()
+    return tool_id, ustruct.unpack_from(fmt, data, HEADER_SIZE)
@@ -0,0 +1,56 @@
+"""
+Pico Claw Agent Tool Helpers
+
+Shared glue for exposing PicoClaw methods as AI agent framework tools.
+
+Wrapping a tool as `json.dumps(claw.gpio_write(...))` makes the payload
+get encoded here, decoded by the framework, and re-encoded for the API
+call; serialization dominates the cost of thin tool proxies. These
+helpers return structured results untouched and pre-encode static
+schemas once at import time.
+
+Usage:
+    from agent_tools import tool_return, encode_tool_schema
+
+    @function_tool
+    def gpio_write(pin: int, value: int):
+        return tool_return(claw.gpio_write(pin, value))
+"""
+
+import json
+from typing import Any, Dict, List, Union
+
+
+def tool_return(result: Dict[str, Any], as_text: bool = False) -> Union[Dict[str, Any], str]:
+    """Return a tool result in the shape the agent framework expects
+
+    Args:
+        result: Response dict from a PicoClaw method
+        as_text: True if the framework only accepts string returns
+
+    Returns:
+        The dict untouched for frameworks with structured returns, or a
+        terse key=value line for text-only frameworks (cheaper than
+        re-serializing to JSON the framework will just echo to the LLM)
+    """
+    if not as_text:
+        return result
+
+    data = result.get("data", result)
+    if isinstance(data, dict):
+        data = data.get("result", data)
+    if isinstance(data, dict):
+        return " ".join(f"{k}={v}" for k, v in data.items())
+    return str(data)
+
+
+def encode_tool_schema(tools: List[Dict[str, Any]]) -> bytes:
+    """Pre-encode a tool schema so every API call reuses the same bytes
+
+    Args:
+        tools: Tool schema list (e.g. PICO_CLAW_TOOLS)
+
+    Returns:
+        Compact UTF-8 encoded JSON
+    """
+    return json.dumps(tools, separators=(",", ":")).encode("utf-8")
@@ -21,37 +21,229 @@ Usage:
     result = claw.execute({"type": "exec", "tool": "pwm_start", "params": {...}})
 """
 
+import base64
+import io
+import os
+import queue
+import select
 import serial
 import json
+import struct
+import sys
+import threading
 import time
+from concurrent.futures import Future
 from typing import Any, Dict, List, Optional, Union
 
+# orjson parses/serializes several times faster than the stdlib json and
+# emits UTF-8 bytes directly; fall back to json when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+# pysimdjson gives SIMD structural scanning plus lazy field access, so
+# responses where only a couple of keys are read skip materialization
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+def _materialize(value):
+    """Copy a lazy simdjson proxy out into plain Python containers
+
+    Reusing the parser invalidates previously returned documents, so
+    anything that outlives the next parse() - in particular results
+    handed across the IO thread to callers - must be materialized
+    first. Plain values pass through untouched.
+    """
+    as_dict = getattr(value, "as_dict", None)
+    if as_dict is not None:
+        return as_dict()
+    as_list = getattr(value, "as_list", None)
+    if as_list is not None:
+        return as_list()
+    return value
+
+
+# ============================================================================
+# Binary Wire Format (mirrors firmware/micropython/wire.py)
+# ============================================================================
+
+WIRE_MAGIC = b"PCLW"
+WIRE_VERSION = 1
+
+# Status byte in binary responses (<len:u16 le><status:u8><payload>)
+WIRE_RESP_OK = 0
+WIRE_RESP_ERR = 1
+
+_WIRE_HEADER = struct.Struct("<4sBBBH")
+
+# Transport framing prefix used in binary mode: <len:u16 le><payload>
+_LEN_PREFIX = struct.Struct("<H")
+
+# Tool name -> (tool_id, precompiled Struct for positional args).
+# Must stay in sync with wire.TOOL_FORMATS on the firmware side.
+WIRE_TOOL_FORMATS = {
+    "gpio_write": (1, struct.Struct("<BB")),
+    "gpio_read": (2, struct.Struct("<B")),
+    "pwm_start": (3, struct.Struct("<BIf")),
+    "pwm_stop": (4, struct.Struct("<B")),
+    "pwm_duty": (5, struct.Struct("<Bf")),
+    "adc_read": (6, struct.Struct("<B")),
+    "adc_read_voltage": (7, struct.Struct("<B")),
+    "delay": (8, struct.Struct("<I")),
+    "get_time": (9, None),
+    "gpio_pulse": (10, struct.Struct("<BHI")),
+}
+
+
+def pack_command(tool: str, *args) -> bytes:
+    """Pack a hot-path tool call into a binary wire frame
+
+    Args:
+        tool: Tool name (must be in WIRE_TOOL_FORMATS)
+        args: Positional arguments in the tool's wire order
+
+    Returns:
+        Encoded frame bytes
+    """
+    tool_id, fmt = WIRE_TOOL_FORMATS[tool]
+    payload = fmt.pack(*args) if fmt else b""
+    header = _WIRE_HEADER.pack(WIRE_MAGIC, WIRE_VERSION, 0, tool_id, len(payload))
+    return header + payload
+
+
+# Pre-serialized templates for the hot tools - the static JSON shell is
+# built once at import and only the variable params are formatted per call
+_GPIO_WRITE_TPL = b'{"type":"exec","tool":"gpio_write","params":{"pin":%d,"value":%d}}\n'
+_GPIO_READ_TPL = b'{"type":"exec","tool":"gpio_read","params":{"pin":%d}}\n'
+_PWM_DUTY_TPL = b'{"type":"exec","tool":"pwm_duty","params":{"pin":%d,"duty":%.6f}}\n'
+_ADC_READ_TPL = b'{"type":"exec","tool":"adc_read","params":{"channel":%d}}\n'
+_DELAY_TPL = b'{"type":"exec","tool":"delay","params":{"milliseconds":%d}}\n'
+_GET_TIME_CMD = b'{"type":"exec","tool":"get_time","params":{}}\n'
+
+# Interned tool names for commands that still go through execute(): the
+# same string object every call means dict builds and the serializer hit
+# their key caches instead of hashing fresh strings.
+_EXEC = sys.intern("exec")
+_TOOL_GPIO_MODE = sys.intern("gpio_mode")
+_TOOL_PWM_START = sys.intern("pwm_start")
+_TOOL_PWM_STOP = sys.intern("pwm_stop")
+_TOOL_ADC_READ_VOLTAGE = sys.intern("adc_read_voltage")
+_TOOL_I2C_SCAN = sys.intern("i2c_scan")
+_TOOL_I2C_READ = sys.intern("i2c_read")
+_TOOL_I2C_WRITE = sys.intern("i2c_write")
+_TOOL_SYSTEM_INFO = sys.intern("system_info")
+_TOOL_SYSTEM_RESET = sys.intern("system_reset")
+
+
+def _mk(tool: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an exec command dict with a consistent shape and key order"""
+    return {"type": _EXEC, "tool": tool, "params": params}
+
+
+def _enable_low_latency(ser: serial.Serial):
+    """Enable low-latency mode on an open serial port (best effort)
+
+    USB-serial drivers buffer reads behind a latency timer (16 ms by
+    default on FTDI/Linux), which dominates round-trip time for short
+    commands. Each mechanism below is platform-specific, so failures
+    are silently ignored.
+    """
+    # pyserial's ASYNC_LOW_LATENCY ioctl (Linux)
+    try:
+        ser.set_low_latency_mode(True)
+    except (AttributeError, ValueError, NotImplementedError, serial.SerialException):
+        pass
+
+    # Linux usb-serial latency_timer sysfs knob (FTDI adapters)
+    if sys.platform.startswith("linux"):
+        dev = os.path.basename(ser.port or "")
+        path = f"/sys/bus/usb-serial/devices/{dev}/latency_timer"
+        try:
+            with open(path, "w") as f:
+                f.write("1")
+        except OSError:
+            pass
+
+    # Windows: return reads as soon as any byte arrives
+    elif sys.platform == "win32":
+        try:
+            import ctypes
+
+            class _COMMTIMEOUTS(ctypes.Structure):
+                _fields_ = [
+                    ("ReadIntervalTimeout", ctypes.c_uint32),
+                    ("ReadTotalTimeoutMultiplier", ctypes.c_uint32),
+                    ("ReadTotalTimeoutConstant", ctypes.c_uint32),
+                    ("WriteTotalTimeoutMultiplier", ctypes.c_uint32),
+                    ("WriteTotalTimeoutConstant", ctypes.c_uint32),
+                ]
+
+            timeouts = _COMMTIMEOUTS(0xFFFFFFFF, 0, 1, 0, 0)
+            handle = ser._port_handle  # pyserial's Win32 handle
+            ctypes.windll.kernel32.SetCommTimeouts(handle, ctypes.byref(timeouts))
+        except (ImportError, AttributeError, OSError):
+            pass
+
 
 class PicoClaw:
     """Client for Pico Claw Agent"""
-    
+
     def __init__(
         self,
         port: str = "/dev/ttyUSB0",
         baudrate: int = 115200,
         timeout: float = 5.0,
-        retry_count: int = 3
+        retry_count: int = 3,
+        low_latency: bool = True
     ):
         """Initialize Pico Claw client
-        
+
         Args:
             port: Serial port path (e.g., /dev/ttyUSB0, COM3)
             baudrate: Communication speed (default 115200)
             timeout: Read timeout in seconds
             retry_count: Number of retries for failed commands
+            low_latency: Disable the driver's read-latency timer if possible
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.retry_count = retry_count
+        self.low_latency = low_latency
         self.serial: Optional[serial.Serial] = None
         self.connected = False
         self.info: Dict[str, Any] = {}
+        # Reused across responses to amortize parser allocation
+        self._parser = simdjson.Parser() if simdjson else None
+        # Persistent receive buffer - serial bytes are read in bulk and
+        # lines are split locally instead of per-byte readline syscalls
+        self._rx_buf = bytearray()
+        # C-buffered reader over the port's fd, set up in connect() on
+        # platforms where the port exposes one
+        self._reader: Optional[io.BufferedReader] = None
+        # Transport framing: "line" (newline-terminated JSON) or "binary"
+        # (length-prefixed frames, negotiated via set_framing())
+        self.framing = "line"
+        # Single writer thread: commands from any thread are queued as
+        # (payload, response reader, Future) so writes never interleave
+        self._io_queue: Optional[queue.Queue] = None
+        self._io_thread: Optional[threading.Thread] = None
+        # Static per-firmware answers, cached for the connection's
+        # lifetime (dropped on connect/disconnect/system_reset)
+        self._tools_cache: Optional[List[str]] = None
+        self._info_cache: Optional[Dict[str, Any]] = None
     
     def connect(self) -> bool:
         """Connect to Pico Claw Agent
@@ -60,25 +252,57 @@ class PicoClaw:
             True if connected successfully
         """
         try:
+            # write_timeout=None keeps writes plainly blocking; a write
+            # timeout pushes some virtual COM drivers into a chunked
+            # timeout mode that serializes URBs
             self.serial = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
                 timeout=self.timeout,
-                write_timeout=1.0
+                write_timeout=None
             )
-            
+
+            if self.low_latency:
+                _enable_low_latency(self.serial)
+
+            # Buffered reader over the port's fd: line splitting happens
+            # in C (memchr) instead of per-byte Python scanning. Ports
+            # without a usable fileno (e.g. Windows handles) stay on the
+            # bulk serial.read path.
+            self._reader = None
+            try:
+                self._reader = io.BufferedReader(
+                    io.FileIO(self.serial.fileno(), closefd=False),
+                    buffer_size=4096,
+                )
+            except (AttributeError, OSError, ValueError):
+                pass
+
+            self._rx_buf.clear()
+            self.framing = "line"  # firmware always boots in line mode
+            self._tools_cache = None
+            self._info_cache = None
+
             # Wait for ready event
-            start_time = time.time()
-            while time.time() - start_time < self.timeout:
+            deadline = time.monotonic() + self.timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # A stashed partial line is not readable yet - only a
+                # buffered newline lets us skip the select wait
+                if b'\n' not in self._rx_buf and not self._wait_readable(remaining):
+                    continue
                 line = self._read_line()
                 if line:
                     try:
-                        msg = json.loads(line)
+                        msg = _loads(line)
                         if msg.get("event") == "ready":
                             self.info = msg.get("data", {})
                             self.connected = True
+                            self._start_io_thread()
                             return True
-                    except json.JSONDecodeError:
+                    except ValueError:
                         pass
             
             return False
@@ -88,51 +312,344 @@ class PicoClaw:
     
     def disconnect(self):
         """Disconnect from Pico Claw Agent"""
+        if self._io_thread is not None:
+            self._io_queue.put(None)  # sentinel: drain and exit
+            self._io_thread.join(timeout=2.0)
+            self._io_thread = None
+            self._io_queue = None
+        if self._reader is not None:
+            try:
+                self._reader.close()
+            except OSError:
+                pass
+            self._reader = None
         if self.serial:
             self.serial.close()
             self.serial = None
         self.connected = False
+        self.framing = "line"
+        self._tools_cache = None
+        self._info_cache = None
     
-    def _read_line(self) -> Optional[str]:
-        """Read a line from serial"""
+    def _read_line(self) -> Optional[bytes]:
+        """Read a line from serial as raw bytes (parsers accept bytes)
+
+        Reads whatever is pending in one bulk serial.read and scans for
+        the newline in the local buffer, so syscalls are O(chunks), not
+        O(bytes). The 1-byte read when nothing is pending blocks up to
+        the port timeout instead of spinning.
+        """
         if not self.serial:
             return None
-        
+
+        if self._reader is not None:
+            return self._read_line_buffered()
+
+        # Bound locals - attribute lookups add up in this polling loop
+        ser = self.serial
+        rx = self._rx_buf
+        idx = rx.find(b'\n')
+        while idx < 0:
+            try:
+                n = ser.in_waiting
+                chunk = ser.read(n if n else 1)
+            except (serial.SerialException, OSError):
+                return None
+            if not chunk:
+                return None
+            rx += chunk
+            idx = rx.find(b'\n')
+
+        line = bytes(rx[:idx])
+        del rx[:idx + 1]
+        return line.rstrip(b'\r')
+
+    def _read_line_buffered(self) -> Optional[bytes]:
+        """Line read through the C-buffered reader (newline scan is memchr)
+
+        pyserial keeps the fd non-blocking and handles timeouts itself,
+        so readline can hand back a partial line when the newline hasn't
+        arrived yet; partials are stashed in _rx_buf until it does.
+        """
         try:
-            if self.serial.in_waiting > 0:
-                line = self.serial.readline()
-                return line.decode('utf-8').strip()
-        except:
-            pass
-        return None
+            chunk = self._reader.readline()
+        except (BlockingIOError, OSError, ValueError):
+            return None
+        if not chunk:
+            return None
+        if chunk[-1] != 0x0A:  # newline not arrived yet
+            self._rx_buf += chunk
+            return None
+        if self._rx_buf:
+            line = bytes(self._rx_buf) + chunk[:-1]
+            self._rx_buf.clear()
+        else:
+            line = chunk[:-1]
+        return line.rstrip(b'\r')
+
+    def _parse_response(self, line: bytes):
+        """Parse a response line with the reusable simdjson parser
+
+        Reusing the parser invalidates the previously returned document,
+        which is fine for this strict request-reply usage. Falls back to
+        _loads when simdjson is not installed.
+        """
+        if self._parser is not None:
+            return self._parser.parse(line)
+        return _loads(line)
+
+    def _at(self, result, pointer: str, default=None):
+        """Fetch a nested response value by JSON pointer
+
+        Uses simdjson's at_pointer (a single C-level call that skips
+        sibling subtrees) when the result is a lazy document, otherwise
+        walks the dict.
+        """
+        at_pointer = getattr(result, "at_pointer", None)
+        if at_pointer is not None:
+            try:
+                return at_pointer(pointer)
+            except (KeyError, TypeError, ValueError):
+                return default
+        node = result
+        for key in pointer.strip("/").split("/"):
+            if not isinstance(node, dict) or key not in node:
+                return default
+            node = node[key]
+        return node
     
-    def _send_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
-        """Send command and wait for response
-        
+    def _send_command(self, payload: bytes) -> Dict[str, Any]:
+        """Send an encoded command and wait for its response
+
         Args:
-            command: Command dictionary
-            
+            payload: Newline-terminated encoded command
+
         Returns:
             Response dictionary
         """
         if not self.connected:
             raise ConnectionError("Not connected to Pico Claw Agent")
-        
-        # Send command
-        cmd_str = json.dumps(command) + "\n"
-        self.serial.write(cmd_str.encode('utf-8'))
-        
-        # Wait for response
-        start_time = time.time()
-        while time.time() - start_time < self.timeout:
+
+        if self.framing == "binary":
+            return self._submit(_LEN_PREFIX.pack(len(payload)) + payload,
+                                self._read_binary_response)
+
+        return self._submit(payload, self._await_response)
+
+    def _start_io_thread(self):
+        """Start the writer thread that owns all post-handshake serial IO"""
+        self._io_queue = queue.Queue()
+        self._io_thread = threading.Thread(target=self._io_loop, daemon=True)
+        self._io_thread.start()
+
+    def _submit(self, payload: bytes, read_response):
+        """Queue a payload for the writer thread and wait for its result
+
+        Args:
+            payload: Fully encoded bytes to put on the wire
+            read_response: Zero-arg callable the IO thread runs to read
+                and parse this payload's response(s)
+        """
+        q = self._io_queue
+        if q is None:
+            # No IO thread (port opened outside connect()); direct path
+            self.serial.write(payload)
+            return _materialize(read_response())
+        fut: Future = Future()
+        q.put((payload, read_response, fut))
+        return fut.result()
+
+    def _io_loop(self):
+        """Writer thread: coalesce queued payloads into one write, then
+        resolve responses in order
+
+        All reads and writes after the handshake happen on this thread,
+        so callers on any thread can never interleave partial frames.
+        Each future is always resolved - readers have their own
+        deadlines - which bounds every _submit wait.
+        """
+        q = self._io_queue
+        stop = False
+        while not stop:
+            batch = [q.get()]
+            if batch[0] is None:
+                break
+            # Drain whatever else is already queued into the same write
+            while True:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                self.serial.write(b"".join(p for p, _, _ in batch))
+            except (serial.SerialException, OSError) as e:
+                for _, _, fut in batch:
+                    fut.set_result({"status": "error", "error": str(e)})
+                continue
+
+            for _, read_response, fut in batch:
+                try:
+                    # Materialize before resolving: the next parse() on
+                    # this thread would invalidate a lazy document while
+                    # the caller is still reading it
+                    fut.set_result(_materialize(read_response()))
+                except Exception as e:
+                    fut.set_result({"status": "error", "error": str(e)})
+
+    def _send_wire(self, tool: str, *args) -> Dict[str, Any]:
+        """Send a hot-path tool call as a binary wire frame
+
+        Only valid in binary framing. The response carries the bare tool
+        result, which is wrapped back into the JSON envelope shape so
+        callers see the same structure under either framing.
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to Pico Claw Agent")
+
+        frame = pack_command(tool, *args)
+        return self._submit(_LEN_PREFIX.pack(len(frame)) + frame,
+                            lambda: self._read_binary_response(bare_result=True))
+
+    def set_framing(self, mode: str = "binary") -> bool:
+        """Switch the transport framing ("line" or "binary")
+
+        Binary framing replaces the ~60-byte JSON envelope of hot-path
+        commands with a length-prefixed struct frame; at 115200 baud the
+        wire, not the CPU, is the throughput ceiling, so fewer bytes is
+        more commands per second. The handshake and its ack travel in
+        the current framing and the switch takes effect afterwards on
+        both ends.
+
+        Args:
+            mode: "line" or "binary"
+
+        Returns:
+            True if the firmware acknowledged the switch
+        """
+        if mode == self.framing:
+            return True
+        result = self.execute({"type": "set_framing", "mode": mode})
+        if self._at(result, "/data/framing") == mode:
+            self.framing = mode
+            return True
+        return False
+
+    def _wait_readable(self, timeout: float) -> bool:
+        """Block until the port is readable or the timeout expires
+
+        Uses select on ports that expose a file descriptor; elsewhere
+        (e.g. Windows handles) returns True and lets the port's own
+        blocking read do the waiting.
+        """
+        # Bytes already sitting in the C reader's buffer are invisible
+        # to select on the fd
+        if self._reader is not None:
+            try:
+                if self._reader.peek(1):
+                    return True
+            except (BlockingIOError, OSError):
+                pass
+        try:
+            fd = self.serial.fileno()
+        except (AttributeError, OSError, ValueError):
+            return True
+        readable, _, _ = select.select([fd], [], [], timeout)
+        return bool(readable)
+
+    def _await_response(self) -> Dict[str, Any]:
+        """Read one response before the deadline
+
+        A monotonic deadline is immune to wall-clock jumps, and select
+        blocks until bytes actually arrive instead of spinning.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # A stashed partial line is not readable yet - only a
+            # buffered newline lets us skip the select wait
+            if b'\n' not in self._rx_buf and not self._wait_readable(remaining):
+                continue
             line = self._read_line()
             if line:
                 try:
-                    return json.loads(line)
-                except json.JSONDecodeError:
+                    return self._parse_response(line)
+                except ValueError:
                     pass
-        
+
         return {"status": "error", "error": "Timeout"}
+
+    def _read_binary_frame(self) -> Optional[tuple]:
+        """Read one binary response frame: <len:u16 le><status:u8><payload>
+
+        Returns:
+            (status byte, payload bytes), or None on timeout
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            if len(self._rx_buf) >= 2:
+                need = 2 + _LEN_PREFIX.unpack_from(self._rx_buf)[0]
+                if len(self._rx_buf) >= need:
+                    status = self._rx_buf[2]
+                    payload = bytes(self._rx_buf[3:need])
+                    del self._rx_buf[:need]
+                    return status, payload
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if not self._wait_readable(remaining):
+                continue
+            try:
+                if self._reader is not None:
+                    chunk = self._reader.read1(4096)
+                else:
+                    n = self.serial.in_waiting
+                    chunk = self.serial.read(n if n else 1)
+            except (BlockingIOError, serial.SerialException, OSError):
+                return None
+            if not chunk:
+                return None
+            self._rx_buf += chunk
+
+    def _read_binary_response(self, bare_result: bool = False) -> Dict[str, Any]:
+        """Read one binary frame and rebuild the JSON envelope shape
+
+        Args:
+            bare_result: True for wire-format tool calls, whose payload
+                is the bare tool result rather than an execute() result
+        """
+        frame = self._read_binary_frame()
+        if frame is None:
+            return {"status": "error", "error": "Timeout"}
+        status, payload = frame
+        if status != WIRE_RESP_OK:
+            return {"status": "error", "error": payload.decode("utf-8", "replace")}
+        try:
+            value = _loads(payload) if payload else None
+        except ValueError:
+            value = payload.decode("utf-8", "replace")
+        if bare_result:
+            return {"status": "ok", "data": {"result": value}}
+        if isinstance(value, dict) and "status" in value:
+            return value  # pre-encoded full envelope (e.g. cached list_tools)
+        return {"status": "ok", "data": value}
+
+    def _collect_responses(self, count: int, bare_result: bool = False) -> List[Dict[str, Any]]:
+        """Collect count responses in order, materializing lazy documents
+
+        Reusing the simdjson parser invalidates the prior document, so
+        batched responses must be converted to plain dicts as they
+        arrive.
+        """
+        if self.framing == "binary":
+            return [self._read_binary_response(bare_result) for _ in range(count)]
+        return [_materialize(self._await_response()) for _ in range(count)]
     
     def execute(self, command: Union[str, Dict]) -> Dict[str, Any]:
         """Execute a general command
@@ -143,19 +660,47 @@ class PicoClaw:
         Returns:
             Result dictionary
         """
+        # Encode once, outside the retry loop; raw JSON strings go
+        # straight to the wire instead of a parse/re-serialize round trip
+        if isinstance(command, str):
+            payload = command.encode("utf-8") + b"\n"
+        else:
+            payload = _dumps(command) + b"\n"
+
+        result: Dict[str, Any] = {"status": "error", "error": "Timeout"}
         for _ in range(self.retry_count):
-            if isinstance(command, str):
-                try:
-                    command = json.loads(command)
-                except json.JSONDecodeError:
-                    return {"status": "error", "error": "Invalid JSON"}
-            
-            result = self._send_command(command)
+            result = self._send_command(payload)
             if result.get("status") != "error" or "Timeout" not in result.get("error", ""):
                 return result
-        
+
         return result
-    
+
+    def execute_many(self, commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Pipeline several commands over a single serial write
+
+        The firmware processes commands in FIFO order, so all commands
+        are flushed at once and the responses collected afterwards -
+        the serial round-trip latency is paid once per batch instead of
+        once per command. Response order matches command order.
+
+        Args:
+            commands: List of command dictionaries
+
+        Returns:
+            List of response dictionaries, one per command
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to Pico Claw Agent")
+
+        if self.framing == "binary":
+            encoded = [_dumps(c) for c in commands]
+            payload = b"".join(_LEN_PREFIX.pack(len(p)) + p for p in encoded)
+        else:
+            payload = b"\n".join(_dumps(c) for c in commands) + b"\n"
+
+        return self._submit(payload,
+                            lambda: self._collect_responses(len(commands)))
+
     # =========================================================================
     # GPIO Methods
     # =========================================================================
@@ -170,11 +715,7 @@ class PicoClaw:
         Returns:
             Result with pin and mode
         """
-        return self.execute({
-            "type": "exec",
-            "tool": "gpio_mode",
-            "params": {"pin": pin, "mode": mode}
-        })
+        return self.execute(_mk(_TOOL_GPIO_MODE, {"pin": pin, "mode": mode}))
     
     def gpio_write(self, pin: int, value: int) -> Dict[str, Any]:
         """Write to GPIO pin
@@ -186,11 +727,35 @@ class PicoClaw:
         Returns:
             Result with pin and value
         """
-        return self.execute({
-            "type": "exec",
-            "tool": "gpio_write",
-            "params": {"pin": pin, "value": value}
-        })
+        if self.framing == "binary":
+            return self._send_wire("gpio_write", pin, value)
+        return self._send_command(_GPIO_WRITE_TPL % (pin, value))
+
+    def gpio_write_many(self, pins_values: List[tuple]) -> List[Dict[str, Any]]:
+        """Write several GPIO pins in one pipelined batch
+
+        Args:
+            pins_values: List of (pin, value) pairs
+
+        Returns:
+            List of results, one per pair, in order
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to Pico Claw Agent")
+
+        if self.framing == "binary":
+            frames = [pack_command("gpio_write", pin, value)
+                      for pin, value in pins_values]
+            payload = b"".join(_LEN_PREFIX.pack(len(f)) + f for f in frames)
+            return self._submit(
+                payload,
+                lambda: self._collect_responses(len(pins_values), bare_result=True))
+
+        payload = b"".join(_GPIO_WRITE_TPL % (pin, value)
+                           for pin, value in pins_values)
+
+        return self._submit(payload,
+                            lambda: self._collect_responses(len(pins_values)))
     
     def gpio_read(self, pin: int) -> Dict[str, Any]:
         """Read GPIO pin
@@ -201,11 +766,9 @@ class PicoClaw:
         Returns:
             Result with pin value
         """
-        return self.execute({
-            "type": "exec",
-            "tool": "gpio_read",
-            "params": {"pin": pin}
-        })
+        if self.framing == "binary":
+            return self._send_wire("gpio_read", pin)
+        return self._send_command(_GPIO_READ_TPL % pin)
     
     # =========================================================================
     # PWM Methods
@@ -227,11 +790,8 @@ class PicoClaw:
         Returns:
             Result with pin, frequency, duty
         """
-        return self.execute({
-            "type": "exec",
-            "tool": "pwm_start",
-            "params": {"pin": pin, "frequency": frequency, "duty": duty}
-        })
+        return self.execute(_mk(_TOOL_PWM_START,
+                                {"pin": pin, "frequency": frequency, "duty": duty}))
     
     def pwm_stop(self, pin: int) -> Dict[str, Any]:
         """Stop PWM on a pin
@@ -242,11 +802,7 @@ class PicoClaw:
         Returns:
             Result with stopped status
         """
-        return self.execute({
-            "type": "exec",
-            "tool": "pwm_stop",
-            "params": {"pin": pin}
-        })
+        return self.execute(_mk(_TOOL_PWM_STOP, {"pin": pin}))
     
     def pwm_duty(self, pin: int, duty: float) -> Dict[str, Any]:
         """Set PWM duty cycle
@@ -258,11 +814,9 @@ class PicoClaw:
         Returns:
             Result with pin and duty
         """
-        return self.execute({
-            "type": "exec",
-            "tool": "pwm_duty",
-            "params": {"pin": pin, "duty": duty}
-        })
+        if self.framing == "binary":
+            return self._send_wire("pwm_duty", pin, duty)
+        return self._send_command(_PWM_DUTY_TPL % (pin, duty))
     
     # =========================================================================
     # ADC Methods
@@ -277,11 +831,9 @@ class PicoClaw:
         Returns:
             Result with raw value
         """
-        return self.execute({
-            "type": "exec",
-            "tool": "adc_read",
-            "params": {"channel": channel}
-        })
+        if self.framing == "binary":
+            return self._send_wire("adc_read", channel)
+        return self._send_command(_ADC_READ_TPL % channel)
     
     def adc_read_voltage(self, channel: int = 0) -> float:
         """Read ADC voltage
@@ -292,16 +844,13 @@ class PicoClaw:
         Returns:
             Voltage in volts
         """
-        result = self.execute({
-            "type": "exec",
-            "tool": "adc_read_voltage",
-            "params": {"channel": channel}
-        })
+        result = self.execute(_mk(_TOOL_ADC_READ_VOLTAGE, {"channel": channel}))
         
-        if result.get("status") == "ok":
-            data = result.get("data", {})
-            return data.get("result", {}).get("voltage", 0.0)
-        return 0.0
+        mv = self._at(result, "/data/result/voltage_mV")
+        if mv is not None:
+            return mv / 1000.0
+        voltage = self._at(result, "/data/result/voltage")
+        return voltage if voltage is not None else 0.0
     
     # =========================================================================
     # I2C Methods
@@ -323,16 +872,11 @@ class PicoClaw:
         Returns:
             List of device addresses
         """
-        result = self.execute({
-            "type": "exec",
-            "tool": "i2c_scan",
-            "params": {"scl": scl, "sda": sda, "frequency": frequency}
-        })
+        result = self.execute(_mk(_TOOL_I2C_SCAN,
+                                  {"scl": scl, "sda": sda, "frequency": frequency}))
         
-        if result.get("status") == "ok":
-            data = result.get("data", {})
-            return data.get("result", {}).get("devices", [])
-        return []
+        devices = self._at(result, "/data/result/devices")
+        return list(devices) if devices is not None else []
     
     def i2c_read(
         self,
@@ -354,22 +898,20 @@ class PicoClaw:
         Returns:
             Data bytes
         """
-        result = self.execute({
-            "type": "exec",
-            "tool": "i2c_read",
-            "params": {
-                "address": address,
-                "register": register,
-                "length": length,
-                "scl": scl,
-                "sda": sda
-            }
-        })
+        result = self.execute(_mk(_TOOL_I2C_READ, {
+            "address": address,
+            "register": register,
+            "length": length,
+            "scl": scl,
+            "sda": sda
+        }))
         
-        if result.get("status") == "ok":
-            data = result.get("data", {})
-            return bytes(data.get("result", {}).get("data", []))
-        return b""
+        b64 = self._at(result, "/data/result/data_b64")
+        if b64 is not None:
+            return base64.b64decode(b64)
+        # Older firmware sends an integer list instead
+        data = self._at(result, "/data/result/data")
+        return bytes(data) if data is not None else b""
     
     def i2c_write(
         self,
@@ -391,25 +933,20 @@ class PicoClaw:
         Returns:
             Number of bytes written
         """
-        if isinstance(data, bytes):
-            data = list(data)
-        
-        result = self.execute({
-            "type": "exec",
-            "tool": "i2c_write",
-            "params": {
-                "address": address,
-                "register": register,
-                "data": data,
-                "scl": scl,
-                "sda": sda
-            }
-        })
+        # hex keeps the payload a flat string: no per-byte int boxing
+        # and half the JSON length of [255,254,...]
+        data_hex = data.hex() if isinstance(data, bytes) else bytes(data).hex()
+
+        result = self.execute(_mk(_TOOL_I2C_WRITE, {
+            "address": address,
+            "register": register,
+            "data_hex": data_hex,
+            "scl": scl,
+            "sda": sda
+        }))
         
-        if result.get("status") == "ok":
-            data = result.get("data", {})
-            return data.get("result", {}).get("written", 0)
-        return 0
+        written = self._at(result, "/data/result/written")
+        return written if written is not None else 0
     
     # =========================================================================
     # System Methods
@@ -417,19 +954,24 @@ class PicoClaw:
     
     def system_info(self) -> Dict[str, Any]:
         """Get system information
-        
+
+        Static per firmware boot, so the round trip is paid once per
+        connection and the cached dict is returned afterwards.
+
         Returns:
             System info dictionary
         """
-        result = self.execute({
-            "type": "exec",
-            "tool": "system_info",
-            "params": {}
-        })
-        
-        if result.get("status") == "ok":
-            return result.get("data", {}).get("result", {})
-        return {}
+        if self._info_cache is not None:
+            return self._info_cache
+
+        result = self.execute(_mk(_TOOL_SYSTEM_INFO, {}))
+
+        info = self._at(result, "/data/result")
+        if info is None:
+            return {}
+        info = _materialize(info)
+        self._info_cache = info
+        return info
     
     def system_reset(self) -> Dict[str, Any]:
         """Reset the Pico
@@ -437,11 +979,9 @@ class PicoClaw:
         Returns:
             Result (will timeout as device resets)
         """
-        return self.execute({
-            "type": "exec",
-            "tool": "system_reset",
-            "params": {}
-        })
+        self._tools_cache = None
+        self._info_cache = None
+        return self.execute(_mk(_TOOL_SYSTEM_RESET, {}))
     
     def get_time(self) -> Dict[str, Any]:
         """Get current time
@@ -449,11 +989,9 @@ class PicoClaw:
         Returns:
             Time dictionary with ms and us
         """
-        return self.execute({
-            "type": "exec",
-            "tool": "get_time",
-            "params": {}
-        })
+        if self.framing == "binary":
+            return self._send_wire("get_time")
+        return self._send_command(_GET_TIME_CMD)
     
     def delay(self, milliseconds: int) -> Dict[str, Any]:
         """Delay for specified milliseconds
@@ -464,11 +1002,9 @@ class PicoClaw:
         Returns:
             Result with delayed_ms
         """
-        return self.execute({
-            "type": "exec",
-            "tool": "delay",
-            "params": {"milliseconds": milliseconds}
-        })
+        if self.framing == "binary":
+            return self._send_wire("delay", milliseconds)
+        return self._send_command(_DELAY_TPL % milliseconds)
     
     # =========================================================================
     # Context Methods
@@ -476,17 +1012,35 @@ class PicoClaw:
     
     def list_tools(self) -> List[str]:
         """List all available tools
-        
+
+        The list is static per firmware, so it is fetched once and
+        memoized for the connection's lifetime; use refresh_tools() to
+        force a new fetch.
+
         Returns:
             List of tool names
         """
+        if self._tools_cache is not None:
+            return self._tools_cache
+
         result = self.execute({
             "type": "list_tools"
         })
-        
-        if result.get("status") == "ok":
-            return result.get("data", {}).get("tools", [])
-        return []
+
+        tools = self._at(result, "/data/tools")
+        tools = list(tools) if tools is not None else []
+        if tools:
+            self._tools_cache = tools
+        return tools
+
+    def refresh_tools(self) -> List[str]:
+        """Drop the cached tool list and fetch it again
+
+        Returns:
+            List of tool names
+        """
+        self._tools_cache = None
+        return self.list_tools()
     
     def context_get(self) -> List[Dict[str, str]]:
         """Get conversation context
@@ -499,9 +1053,8 @@ class PicoClaw:
             "action": "get"
         })
         
-        if result.get("status") == "ok":
-            return result.get("data", {}).get("history", [])
-        return []
+        history = self._at(result, "/data/history")
+        return list(history) if history is not None else []
     
     def context_add(self, role: str, content: str) -> Dict[str, Any]:
         """Add to conversation context
@@ -550,9 +1103,7 @@ class PicoClaw:
             "key": key
         })
         
-        if result.get("status") == "ok":
-            return result.get("data", {}).get("value")
-        return None
+        return self._at(result, "/data/value")
     
     def state_set(self, key: str, value: Any) -> Dict[str, Any]:
         """Set state value
@@ -576,31 +1127,108 @@ class PicoClaw:
 # Convenience Functions
 # ============================================================================
 
-def auto_connect(baudrate: int = 115200) -> Optional[PicoClaw]:
+# Raspberry Pi USB VID and known Pico CDC PIDs (MicroPython, Pico SDK)
+PICO_VID = 0x2E8A
+PICO_PIDS = (0x0005, 0x000A)
+
+_LAST_PORT_FILE = os.path.join(os.path.expanduser("~"), ".pico_claw", "last_port")
+
+
+def _read_last_port() -> Optional[str]:
+    """Read the cached last-known working port, if any"""
+    try:
+        with open(_LAST_PORT_FILE) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _write_last_port(device: str):
+    """Remember a working port so the next run skips probing"""
+    try:
+        os.makedirs(os.path.dirname(_LAST_PORT_FILE), exist_ok=True)
+        with open(_LAST_PORT_FILE, "w") as f:
+            f.write(device)
+    except OSError:
+        pass
+
+
+def _try_connect(device: str, baudrate: int, low_latency: bool) -> Optional[PicoClaw]:
+    """Attempt to connect to a single port"""
+    try:
+        claw = PicoClaw(port=device, baudrate=baudrate, low_latency=low_latency)
+        if claw.connect():
+            return claw
+        claw.disconnect()
+    except (ConnectionError, serial.SerialException, OSError):
+        pass
+    return None
+
+
+def auto_connect(baudrate: int = 115200, low_latency: bool = True) -> Optional[PicoClaw]:
     """Auto-detect and connect to Pico Claw
-    
+
+    Tries the last-known working port first, then only ports matching
+    the Raspberry Pi USB VID/PID - opening a port costs a full serial
+    handshake, so non-candidates are never probed. When several
+    candidates remain they handshake in parallel, since the wait-for-
+    ready is IO-bound.
+
     Args:
         baudrate: Communication speed
-        
+        low_latency: Disable the driver's read-latency timer if possible
+
     Returns:
         PicoClaw instance or None if not found
     """
     import serial.tools.list_ports
-    
+
     ports = list(serial.tools.list_ports.comports())
-    
-    for port in ports:
-        # Try common Pico port identifiers
-        if "USB" in port.device or "ACM" in port.device or "SLAB" in port.device:
-            try:
-                claw = PicoClaw(port=port.device, baudrate=baudrate)
-                if claw.connect():
-                    return claw
-                claw.disconnect()
-            except:
-                pass
-    
-    return None
+    devices = [p.device for p in ports]
+
+    candidates = [p.device for p in ports if p.vid == PICO_VID and
+                  (p.pid in PICO_PIDS or p.pid is None)]
+    if not candidates:
+        # Fallback for adapters/bootloaders without the Pico VID
+        candidates = [d for d in devices
+                      if "USB" in d or "ACM" in d or "SLAB" in d]
+
+    # Last-known working port goes first, serially - the common case
+    # should not pay for a thread pool
+    last = _read_last_port()
+    if last in devices:
+        claw = _try_connect(last, baudrate, low_latency)
+        if claw:
+            _write_last_port(last)
+            return claw
+        candidates = [d for d in candidates if d != last]
+
+    if not candidates:
+        return None
+    if len(candidates) == 1:
+        claw = _try_connect(candidates[0], baudrate, low_latency)
+        if claw:
+            _write_last_port(candidates[0])
+        return claw
+
+    # Probe the remaining candidates in parallel; keep the first match
+    # in candidate order and close the rest
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(
+            lambda d: _try_connect(d, baudrate, low_latency), candidates))
+
+    winner = None
+    for device, claw in zip(candidates, results):
+        if claw is None:
+            continue
+        if winner is None:
+            winner = claw
+            _write_last_port(device)
+        else:
+            claw.disconnect()
+    return winner
 
 
 # ============================================================================
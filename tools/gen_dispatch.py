@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Generate firmware/micropython/_dispatch.py
+
+Emits a switch-style dispatcher for the binary wire path so tool calls
+avoid the dict lookup and **params keyword binding of ToolRegistry.call.
+The wire format table (wire.TOOL_FORMATS) is the source of truth; rerun
+this script after adding or changing a binary tool encoding:
+
+    python tools/gen_dispatch.py
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIRMWARE_DIR = os.path.join(ROOT, "firmware", "micropython")
+OUTPUT = os.path.join(FIRMWARE_DIR, "_dispatch.py")
+
+sys.path.insert(0, FIRMWARE_DIR)
+import wire  # noqa: E402
+
+
+def _arity(fmt):
+    """Number of positional args encoded by a wire format string"""
+    return len(fmt.lstrip("<")) if fmt else 0
+
+
+def generate():
+    """Build the _dispatch.py source text"""
+    entries = sorted((tool_id, name, fmt) for name, (tool_id, fmt) in wire.TOOL_FORMATS.items())
+
+    lines = [
+        '"""',
+        'Generated by tools/gen_dispatch.py - do not edit by hand.',
+        '"""',
+        '',
+        '',
+        'def build_dispatch(registry):',
+        '    """Bind registry tool methods into a positional switch dispatcher"""',
+    ]
+    for _tool_id, name, _fmt in entries:
+        lines.append(f'    _{name} = registry._{name}')
+    lines.append('')
+    lines.append('    def dispatch(tool_id, args):')
+    branch = 'if'
+    for tool_id, name, fmt in entries:
+        call_args = ', '.join(f'args[{i}]' for i in range(_arity(fmt)))
+        lines.append(f'        {branch} tool_id == {tool_id}:')
+        lines.append(f'            return _{name}({call_args})')
+        branch = 'elif'
+    lines.append('        return None')
+    lines.append('')
+    lines.append('    return dispatch')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def main():
+    source = generate()
+    with open(OUTPUT, "w") as f:
+        f.write(source)
+    print(f"Wrote {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()